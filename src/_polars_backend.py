@@ -0,0 +1,101 @@
+# src/_polars_backend.py
+# Polars versions of the alignment/aggregation/merge steps, used with backend='polars'
+
+import pandas as pd
+import polars as pl
+
+
+def _from_pandas(df: pd.DataFrame, date_column: str) -> pl.DataFrame:
+    """
+    Convert to polars with the date column in one unit, so join keys match even
+    when pandas stored the two sides with different resolutions (e.g. s vs us).
+    """
+    return pl.from_pandas(df).with_columns(pl.col(date_column).cast(pl.Datetime('us')))
+
+
+def align_datasets_by_date(news_df: pd.DataFrame, stock_df: pd.DataFrame,
+                           date_column: str = 'date'):
+    """
+    Keep only rows whose (already normalized) date appears in both datasets.
+
+    Args:
+        news_df (pd.DataFrame): News headlines DataFrame
+        stock_df (pd.DataFrame): Stock price DataFrame
+        date_column (str): The name of the date column in both DataFrames
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: Tuple of aligned news and stock DataFrames
+    """
+    news = _from_pandas(news_df, date_column).lazy()
+    stock = _from_pandas(stock_df, date_column).lazy()
+    news_days = news.select(date_column).drop_nulls().unique()
+    stock_days = stock.select(date_column).drop_nulls().unique()
+
+    aligned_news = news.join(stock_days, on=date_column, how='semi', maintain_order='left')
+    aligned_stock = stock.join(news_days, on=date_column, how='semi', maintain_order='left')
+    aligned_news, aligned_stock = pl.collect_all([aligned_news, aligned_stock])
+    return aligned_news.to_pandas(), aligned_stock.to_pandas()
+
+
+def aggregate_daily_sentiment(df: pd.DataFrame, date_column: str = 'date') -> pd.DataFrame:
+    """
+    Aggregate average sentiment by date.
+
+    Args:
+        df (pd.DataFrame): DataFrame with 'date' and 'sentiment' columns
+        date_column (str): Column name containing date information
+
+    Returns:
+        pd.DataFrame: Aggregated sentiment per day
+    """
+    return (
+        pl.from_pandas(df[[date_column, 'sentiment']])
+        .lazy()
+        .drop_nulls(date_column)
+        .group_by(date_column)
+        .agg(pl.col('sentiment').mean().alias('avg_sentiment'))
+        .sort(date_column)
+        .collect()
+        .to_pandas()
+    )
+
+
+def calculate_daily_returns(df: pd.DataFrame, price_column: str = 'Close',
+                            date_column: str = 'date') -> pd.DataFrame:
+    """
+    Calculate daily stock return as percentage change of closing price.
+
+    Args:
+        df (pd.DataFrame): DataFrame containing stock price data
+        price_column (str): Column name for closing prices
+        date_column (str): Date column to sort by
+
+    Returns:
+        pd.DataFrame: DataFrame sorted by date with new 'daily_return' column
+    """
+    return (
+        pl.from_pandas(df)
+        .lazy()
+        .sort(date_column, maintain_order=True, nulls_last=True)
+        .with_columns(pl.col(price_column).cast(pl.Float64).pct_change().alias('daily_return'))
+        .collect()
+        .to_pandas()
+    )
+
+
+def merge_sentiment_with_returns(stock_df: pd.DataFrame, sentiment_df: pd.DataFrame,
+                                 date_column: str = 'date') -> pd.DataFrame:
+    """
+    Merge stock return data and average sentiment data by date.
+
+    Args:
+        stock_df (pd.DataFrame): DataFrame with daily returns
+        sentiment_df (pd.DataFrame): DataFrame with average daily sentiment
+        date_column (str): Common date column to merge on
+
+    Returns:
+        pd.DataFrame: Merged DataFrame with 'daily_return' and 'avg_sentiment'
+    """
+    stock = _from_pandas(stock_df, date_column)
+    sentiment = _from_pandas(sentiment_df, date_column)
+    return stock.join(sentiment, on=date_column, how='inner', maintain_order='left').to_pandas()
@@ -1,10 +1,11 @@
 # src/correlation_analysis.py
 
+import numpy as np
 import pandas as pd
-from scipy.stats import pearsonr
 
 
-def calculate_daily_returns(df: pd.DataFrame, price_column: str = 'Close', date_column: str = 'date') -> pd.DataFrame:
+def calculate_daily_returns(df: pd.DataFrame, price_column: str = 'Close', date_column: str = 'date',
+                            backend: str = 'pandas') -> pd.DataFrame:
     """
     Calculate daily stock return as percentage change of closing price.
 
@@ -12,18 +13,31 @@ def calculate_daily_returns(df: pd.DataFrame, price_column: str = 'Close', date_
         df (pd.DataFrame): DataFrame containing stock price data
         price_column (str): Column name for closing prices
         date_column (str): Date column to sort by
+        backend (str): 'pandas' (default) or 'polars' to run the step with polars
 
     Returns:
         pd.DataFrame: DataFrame with new 'daily_return' column
     """
-    df = df.sort_values(date_column).copy()
-    df['daily_return'] = df[price_column].pct_change()
-    return df
+    if backend == 'polars':
+        from src._polars_backend import calculate_daily_returns as polars_daily_returns
+        return polars_daily_returns(df, price_column, date_column)
+    if backend != 'pandas':
+        raise ValueError(f"Unknown backend: {backend}. Use 'pandas' or 'polars'.")
+
+    # Work on the price column alone instead of copying the whole frame
+    order = np.argsort(df[date_column].to_numpy(), kind='stable')
+    close = np.ascontiguousarray(df[price_column].to_numpy()[order], dtype=np.float64)
+
+    returns = np.empty_like(close)
+    returns[:1] = np.nan
+    np.divide(np.diff(close), close[:-1], out=returns[1:])
+    return df.iloc[order].assign(daily_return=returns)
 
 
 def merge_sentiment_with_returns(stock_df: pd.DataFrame,
                                   sentiment_df: pd.DataFrame,
-                                  date_column: str = 'date') -> pd.DataFrame:
+                                  date_column: str = 'date',
+                                  backend: str = 'pandas') -> pd.DataFrame:
     """
     Merge stock return data and average sentiment data by date.
 
@@ -31,16 +45,23 @@ def merge_sentiment_with_returns(stock_df: pd.DataFrame,
         stock_df (pd.DataFrame): DataFrame with daily returns
         sentiment_df (pd.DataFrame): DataFrame with average daily sentiment
         date_column (str): Common date column to merge on
+        backend (str): 'pandas' (default) or 'polars' to run the step with polars
 
     Returns:
         pd.DataFrame: Merged DataFrame with 'daily_return' and 'avg_sentiment'
     """
+    if backend == 'polars':
+        from src._polars_backend import merge_sentiment_with_returns as polars_merge
+        return polars_merge(stock_df, sentiment_df, date_column)
+    if backend != 'pandas':
+        raise ValueError(f"Unknown backend: {backend}. Use 'pandas' or 'polars'.")
     return pd.merge(stock_df, sentiment_df, on=date_column, how='inner')
 
 
 def compute_correlation(df: pd.DataFrame,
                          return_col: str = 'daily_return',
-                         sentiment_col: str = 'avg_sentiment') -> float:
+                         sentiment_col: str = 'avg_sentiment',
+                         return_pvalue: bool = False):
     """
     Compute Pearson correlation between sentiment and stock returns.
 
@@ -48,11 +69,23 @@ def compute_correlation(df: pd.DataFrame,
         df (pd.DataFrame): DataFrame containing sentiment and returns
         return_col (str): Column name for returns
         sentiment_col (str): Column name for sentiment
+        return_pvalue (bool): If True, also compute the two-sided p-value with scipy
 
     Returns:
-        float: Pearson correlation coefficient
+        float: Pearson correlation coefficient, or a (corr, p_value) tuple if
+        return_pvalue is True
     """
-    df = df.dropna(subset=[return_col, sentiment_col])
-    corr, p_value = pearsonr(df[return_col], df[sentiment_col])
+    values = df[[return_col, sentiment_col]].to_numpy(dtype=np.float64)
+    values = values[~np.isnan(values).any(axis=1)]
+    x = values[:, 0] - values[:, 0].mean()
+    y = values[:, 1] - values[:, 1].mean()
+    corr = (x @ y) / np.sqrt((x @ x) * (y @ y))
+
+    if not return_pvalue:
+        print(f"📈 Pearson correlation: {corr:.4f}")
+        return corr
+
+    from scipy.stats import pearsonr
+    _, p_value = pearsonr(values[:, 0], values[:, 1])
     print(f"📈 Pearson correlation: {corr:.4f} (p-value: {p_value:.4f})")
-    return corr
+    return corr, p_value
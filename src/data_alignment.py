@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -5,20 +6,33 @@ def normalize_dates(df: pd.DataFrame, date_column: str = 'date') -> pd.DataFrame
     """
     Normalize the datetime column in a DataFrame by removing time component and timezone.
 
+    The column keeps the local wall-clock date and stays datetime64
+    (int64-backed) so downstream groupby, merge and isin avoid Python objects.
+
     Args:
         df (pd.DataFrame): DataFrame with a date column.
         date_column (str): Column name of the date field.
 
     Returns:
-        pd.DataFrame: DataFrame with normalized date column as datetime.date
+        pd.DataFrame: DataFrame with normalized date column as datetime64 at midnight
     """
     if date_column in df.columns:
-        df[date_column] = pd.to_datetime(df[date_column], errors='coerce').dt.tz_localize(None).dt.date
+        df[date_column] = pd.to_datetime(df[date_column], errors='coerce').dt.tz_localize(None).dt.normalize()
     return df
 
 
+_NAT_DAY = np.datetime64('NaT', 'D').view('int64')
+
+
+def _day_numbers(dates: pd.Series) -> np.ndarray:
+    """
+    Convert a date column to int64 day numbers (days since epoch, NaT as int64 min).
+    """
+    return dates.to_numpy(dtype='datetime64[D]').view('int64')
+
+
 def align_datasets_by_date(news_df: pd.DataFrame, stock_df: pd.DataFrame,
-                            date_column: str = 'date') -> pd.DataFrame:
+                            date_column: str = 'date', backend: str = 'pandas') -> pd.DataFrame:
     """
     Normalize and align two datasets by their date column.
 
@@ -26,6 +40,7 @@ def align_datasets_by_date(news_df: pd.DataFrame, stock_df: pd.DataFrame,
         news_df (pd.DataFrame): News headlines DataFrame
         stock_df (pd.DataFrame): Stock price DataFrame
         date_column (str): The name of the date column in both DataFrames
+        backend (str): 'pandas' (default) or 'polars' to run the step with polars
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: Tuple of aligned news and stock DataFrames
@@ -36,10 +51,19 @@ def align_datasets_by_date(news_df: pd.DataFrame, stock_df: pd.DataFrame,
     
     news_df = normalize_dates(news_df, date_column)
     stock_df = normalize_dates(stock_df, date_column)
-    
-    # Inner join to filter only overlapping dates
-    overlapping_dates = set(news_df[date_column]) & set(stock_df[date_column])
-    news_df = news_df[news_df[date_column].isin(overlapping_dates)]
-    stock_df = stock_df[stock_df[date_column].isin(overlapping_dates)]
+
+    if backend == 'polars':
+        from src._polars_backend import align_datasets_by_date as polars_align
+        return polars_align(news_df, stock_df, date_column)
+    if backend != 'pandas':
+        raise ValueError(f"Unknown backend: {backend}. Use 'pandas' or 'polars'.")
+
+    # Inner join to filter only overlapping dates, compared as int64 day numbers
+    news_days = _day_numbers(news_df[date_column])
+    stock_days = _day_numbers(stock_df[date_column])
+    overlapping_days = np.intersect1d(news_days, stock_days)
+    overlapping_days = overlapping_days[overlapping_days != _NAT_DAY]
+    news_df = news_df[np.isin(news_days, overlapping_days)]
+    stock_df = stock_df[np.isin(stock_days, overlapping_days)]
 
     return news_df.reset_index(drop=True), stock_df.reset_index(drop=True)
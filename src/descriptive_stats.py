@@ -1,8 +1,7 @@
 import pandas as pd
 import os
 from typing import Tuple
-import matplotlib.pyplot as plt
-import seaborn as sns
+from src.ingest_data import read_csv_columns
 
 class DescriptiveStats:
     """
@@ -21,7 +20,7 @@ class DescriptiveStats:
 
     def _load_data(self) -> pd.DataFrame:
         """
-        Load the CSV file and parse the date.
+        Load the headline, publisher and date columns of the CSV file and parse the date.
 
         Returns:
             pd.DataFrame: Loaded DataFrame.
@@ -29,7 +28,7 @@ class DescriptiveStats:
         if not os.path.exists(self.filepath):
             raise FileNotFoundError(f"File not found: {self.filepath}")
         
-        df = pd.read_csv(self.filepath)
+        df = read_csv_columns(self.filepath, ['headline', 'publisher', 'date'])
         
         # Explicitly convert date column to datetime format
         if 'date' in df.columns:
@@ -45,7 +44,7 @@ class DescriptiveStats:
         Returns:
             pd.Series: Descriptive statistics.
         """
-        self.df['headline_length'] = self.df['headline'].astype(str).apply(len)
+        self.df['headline_length'] = self.df['headline'].astype('string').str.len().fillna(0).astype('int32')
         return self.df['headline_length'].describe()
 
     def articles_per_publisher(self) -> pd.Series:
@@ -57,16 +56,26 @@ class DescriptiveStats:
         """
         return self.df['publisher'].value_counts()
 
-    def plot_publication_trends(self):
+    def plot_publication_trends(self, max_points: int = 1000):
         """
-        Plot number of articles published per day.
+        Plot number of articles published per day, or per week when the
+        date range spans more than max_points days.
+
+        Args:
+            max_points (int): Maximum number of daily points to plot before resampling weekly.
         """
-        self.df['date_only'] = self.df['date'].dt.date
-        daily_counts = self.df['date_only'].value_counts().sort_index()
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        counts = self.df[['date']].dropna().set_index('date').resample('D').size()
+        period = "Day"
+        if len(counts) > max_points:
+            counts = counts.resample('W').sum()
+            period = "Week"
 
         plt.figure(figsize=(12, 5))
-        sns.lineplot(x=daily_counts.index, y=daily_counts.values)
-        plt.title("📈 Article Publication Frequency Over Time")
+        sns.lineplot(x=counts.index, y=counts.to_numpy())
+        plt.title(f"📈 Article Publication Frequency Over Time (per {period})")
         plt.xlabel("Date")
         plt.ylabel("Number of Articles")
         plt.xticks(rotation=45)
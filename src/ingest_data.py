@@ -1,8 +1,11 @@
 import os
 import zipfile
 from abc import ABC, abstractmethod
+from typing import List
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
 
 
 # Define an abstract class for Data Ingestor
@@ -42,6 +45,31 @@ class ZipDataIngestor(DataIngestor):
         return df
 
 
+def read_csv_columns(file_path: str, columns: List[str]) -> pd.DataFrame:
+    """
+    Read only the given columns of a CSV file using pyarrow's multithreaded parser.
+
+    Columns are read as strings (empty cells as missing) so dates keep their
+    original UTC offset until they are parsed with pd.to_datetime. Requested
+    columns missing from the file are skipped, as when reading every column.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        columns (List[str]): Names of the columns to read.
+
+    Returns:
+        pd.DataFrame: DataFrame with the requested columns present in the file.
+    """
+    header = pd.read_csv(file_path, nrows=0).columns
+    columns = [column for column in columns if column in header]
+    convert_options = pv.ConvertOptions(
+        include_columns=columns,
+        column_types={column: pa.string() for column in columns},
+        strings_can_be_null=True,
+    )
+    return pv.read_csv(file_path, convert_options=convert_options).to_pandas()
+
+
 # Implement a Factory to create DataIngestors
 class DataIngestorFactory:
     @staticmethod
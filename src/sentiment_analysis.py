@@ -1,7 +1,58 @@
 # src/sentiment_analysis.py
 
+import itertools
+import re
+
+import numpy as np
 import pandas as pd
-from textblob import TextBlob
+from joblib import Parallel, delayed, effective_n_jobs
+from numba import njit
+from textblob.en import sentiment as pattern_lexicon
+from textblob.en.sentiments import PatternAnalyzer
+
+# Tokens as TextBlob's tokenizer produces them: whitespace-separated words with
+# leading/trailing punctuation removed, split at apostrophes ("isn't" -> "is", "n", "t"),
+# plus "!", "..." and the irony mark "(!)" on their own
+_PUNCTUATION = re.escape(".,;:!?()[]{}`\"@#$^&*+-|=~_")
+_SEPARATORS = "\\s'\u2018\u2019\u201c\u201d"
+_TOKEN_PATTERN = re.compile(
+    f"\\(!\\)|[^{_SEPARATORS}{_PUNCTUATION}](?:[^{_SEPARATORS}]*[^{_SEPARATORS}{_PUNCTUATION}])?|!|\\.\\.\\."
+)
+_NEGATIONS = ("no", "not", "never")
+
+# Below this many rows, starting worker processes costs more than it saves
+_PARALLEL_MIN_ROWS = 10_000
+
+
+def _load_lexicon():
+    """
+    Load TextBlob's pattern lexicon into flat arrays for vectorized lookups.
+
+    Returns:
+        Tuple[pd.Series, np.ndarray, np.ndarray, np.ndarray, np.ndarray]: word -> id
+        index, and polarity, subjectivity, intensity and is-adverb arrays aligned
+        with the ids
+    """
+    words, polarity, subjectivity, intensity, is_adverb = [], [], [], [], []
+    for word, scores in pattern_lexicon.items():
+        # The None key holds the scores averaged over all part-of-speech tags
+        p, s, i = scores[None]
+        words.append(word)
+        polarity.append(p)
+        subjectivity.append(s)
+        intensity.append(i)
+        # Adverbs ("very", "really") modify the polarity of the next known word
+        is_adverb.append('RB' in scores)
+    word_ids = pd.Series(np.arange(len(words)), index=words)
+    return (word_ids, np.asarray(polarity, dtype=np.float64), np.asarray(subjectivity, dtype=np.float64),
+            np.asarray(intensity, dtype=np.float64), np.asarray(is_adverb, dtype=np.bool_))
+
+
+_WORD_IDS, _POLARITY, _SUBJECTIVITY, _INTENSITY, _IS_ADVERB = _load_lexicon()
+
+# The analyzer TextBlob(text).sentiment delegates to, built once instead of per call
+_ANALYZER = PatternAnalyzer()
+
 
 def get_sentiment(text: str) -> float:
     """
@@ -14,33 +65,179 @@ def get_sentiment(text: str) -> float:
         float: Sentiment polarity score between -1.0 (negative) to +1.0 (positive)
     """
     try:
-        return TextBlob(text).sentiment.polarity
+        return _ANALYZER.analyze(text).polarity
     except:
         return 0.0
 
-def apply_sentiment_analysis(df: pd.DataFrame, text_column: str = 'headline') -> pd.DataFrame:
+@njit(cache=True)
+def _assess(row_id, ids, token_lengths, is_negation, is_exclamation, is_irony, ends_ly,
+            polarity, intensity, is_adverb, n_rows):
+    """
+    Replay TextBlob's pattern assessment rules over the flat token arrays and
+    return the mean assessed polarity of each row.
+
+    A known word preceded by an adverb forms one assessment with the adverb's
+    intensity applied ("very good"); a negation before it ("not very good")
+    flips and halves the assessment, "!" boosts the last one by 25% and "(!)"
+    adds a neutral one.
+    """
+    totals = np.zeros(n_rows)
+    counts = np.zeros(n_rows)
+    row = -1
+    has_last = False
+    last_p = 0.0
+    last_i = 1.0
+    last_negated = False
+    modifier = -1
+    negated = False
+
+    for t in range(ids.shape[0] + 1):
+        # Flush the open assessment at the end of each row
+        if t == ids.shape[0] or row_id[t] != row:
+            if has_last:
+                totals[row] += -0.5 * last_p if last_negated else last_p
+                counts[row] += 1
+            if t == ids.shape[0]:
+                break
+            row = row_id[t]
+            has_last = False
+            modifier = -1
+            negated = False
+
+        w = ids[t]
+        if w >= 0:
+            if modifier < 0:
+                if has_last:
+                    totals[row] += -0.5 * last_p if last_negated else last_p
+                    counts[row] += 1
+                has_last = True
+                last_p = polarity[w]
+                last_negated = False
+            else:
+                last_p = max(-1.0, min(polarity[w] * last_i, 1.0))
+            last_i = intensity[w]
+            if negated:
+                last_i = 1.0 / last_i
+                last_negated = True
+            modifier = t if is_adverb[w] else -1
+            negated = is_negation[t]
+        else:
+            # Negations and adverbs carry over small words ("not a good")
+            if is_negation[t]:
+                negated = True
+            elif negated and token_lengths[t] > 1:
+                negated = False
+            # "really not good": the negation attaches to the -ly adverb
+            if negated and modifier >= 0 and ends_ly[modifier]:
+                last_negated = True
+                negated = False
+            elif modifier >= 0 and token_lengths[t] > 2:
+                modifier = -1
+            if is_exclamation[t] and has_last:
+                last_p = max(-1.0, min(last_p * 1.25, 1.0))
+            if is_irony[t]:
+                if has_last:
+                    totals[row] += -0.5 * last_p if last_negated else last_p
+                    counts[row] += 1
+                has_last = True
+                last_p = 0.0
+                last_i = 1.0
+                last_negated = False
+
+    return totals / np.maximum(counts, 1)
+
+def _lexicon_scores(texts: pd.Series) -> np.ndarray:
+    """
+    Score texts with TextBlob's polarity lexicon in one vectorized pass.
+
+    Headlines are tokenized and looked up in the lexicon in bulk, then a
+    compiled loop applies TextBlob's adverb, negation and "!" rules, so scores
+    match TextBlob's except for emoticons and abbreviations.
+    """
+    n = len(texts)
+    texts = texts.fillna('').astype(str).str.lower().str.replace("n't", " n't", regex=False)
+    tokens = texts.str.findall(_TOKEN_PATTERN)
+    lengths = tokens.str.len().to_numpy(dtype=np.intp)
+    row_id = np.repeat(np.arange(n), lengths)
+
+    # Map every token to its lexicon id; tokens outside the lexicon get -1
+    flat = pd.Series(list(itertools.chain.from_iterable(tokens)), dtype=object)
+    ids = _WORD_IDS.reindex(flat).fillna(-1).to_numpy(dtype=np.intp)
+
+    return _assess(
+        row_id, ids,
+        flat.str.len().to_numpy(dtype=np.intp),
+        flat.isin(_NEGATIONS).to_numpy(),
+        (flat == '!').to_numpy(),
+        (flat == '(!)').to_numpy(),
+        flat.str.endswith('ly').to_numpy(dtype=np.bool_),
+        _POLARITY, _INTENSITY, _IS_ADVERB, n,
+    )
+
+def _score_chunk(texts: np.ndarray) -> np.ndarray:
+    """
+    Score a chunk of texts with the full TextBlob analyzer (runs in a worker process).
+    """
+    return np.array([get_sentiment(text) for text in texts], dtype=np.float64)
+
+def _textblob_scores(texts: pd.Series, n_jobs: int) -> np.ndarray:
+    """
+    Score texts with the full TextBlob analyzer, spread over worker processes
+    for large inputs.
+    """
+    values = texts.to_numpy(dtype=object)
+    n_jobs = effective_n_jobs(n_jobs)
+    if n_jobs == 1 or len(values) < _PARALLEL_MIN_ROWS:
+        return _score_chunk(values)
+
+    chunks = np.array_split(values, n_jobs * 4)
+    scores = Parallel(n_jobs=n_jobs, backend='loky')(delayed(_score_chunk)(chunk) for chunk in chunks)
+    return np.concatenate(scores)
+
+def apply_sentiment_analysis(df: pd.DataFrame, text_column: str = 'headline',
+                             method: str = 'lexicon', n_jobs: int = -1) -> pd.DataFrame:
     """
     Add sentiment scores to a DataFrame using TextBlob.
 
+    The default 'lexicon' method looks up TextBlob's polarity lexicon in one
+    vectorized pass and applies its adverb and negation rules in a compiled
+    loop, matching TextBlob except for emoticons. The 'textblob' method runs the full
+    TextBlob analyzer on each text, in parallel processes for large frames.
+
     Args:
         df (pd.DataFrame): DataFrame containing text data
         text_column (str): Name of the column containing the headline
+        method (str): 'lexicon' (fast, default) or 'textblob' (exact TextBlob scores)
+        n_jobs (int): Number of worker processes for the 'textblob' method (-1 = all cores)
 
     Returns:
         pd.DataFrame: Original DataFrame with new 'sentiment' column
     """
-    df['sentiment'] = df[text_column].apply(get_sentiment)
+    if method == 'lexicon':
+        df['sentiment'] = _lexicon_scores(df[text_column])
+    elif method == 'textblob':
+        df['sentiment'] = _textblob_scores(df[text_column], n_jobs)
+    else:
+        raise ValueError(f"Unknown method: {method}. Use 'lexicon' or 'textblob'.")
     return df
 
-def aggregate_daily_sentiment(df: pd.DataFrame, date_column: str = 'date') -> pd.DataFrame:
+def aggregate_daily_sentiment(df: pd.DataFrame, date_column: str = 'date',
+                              backend: str = 'pandas') -> pd.DataFrame:
     """
     Aggregate average sentiment by date.
 
     Args:
         df (pd.DataFrame): DataFrame with 'date' and 'sentiment' columns
         date_column (str): Column name containing date information
+        backend (str): 'pandas' (default) or 'polars' to run the step with polars
 
     Returns:
         pd.DataFrame: Aggregated sentiment per day
     """
+    if backend == 'polars':
+        from src._polars_backend import aggregate_daily_sentiment as polars_aggregate
+        return polars_aggregate(df, date_column)
+    if backend != 'pandas':
+        raise ValueError(f"Unknown backend: {backend}. Use 'pandas' or 'polars'.")
+
     return df.groupby(date_column)['sentiment'].mean().reset_index(name='avg_sentiment')
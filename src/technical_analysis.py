@@ -1,12 +1,97 @@
 import pandas as pd
+import numpy as np
 import os
 import glob
-import matplotlib.pyplot as plt
-import seaborn as sns
+import json
+from concurrent.futures import ThreadPoolExecutor
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
 import talib
+from numba import njit
 import yfinance as yf
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+
+
+@njit(cache=True)
+def _ewm_step(value, weight, x, alpha):
+    """
+    One step of pandas' ewm(adjust=False).mean(): a missing price keeps the
+    previous value while its weight keeps decaying.
+    """
+    if value != value:
+        return x, 1.0
+    weight *= 1.0 - alpha
+    if x == x:
+        if value != x:
+            value = (weight * value + alpha * x) / (weight + alpha)
+        weight = 1.0
+    return value, weight
+
+
+@njit(cache=True)
+def _indicators(close, sma20, sma50, rsi, macd, signal):
+    """
+    Compute SMA20, SMA50, RSI14, MACD(12, 26) and its 9-period signal line in a
+    single pass over the closing prices, writing into the given output arrays.
+    Missing prices are handled like the equivalent pandas rolling/ewm calls.
+    """
+    n = close.shape[0]
+    alpha12, alpha26, alpha9 = 2.0 / 13.0, 2.0 / 27.0, 2.0 / 10.0
+    sum20 = 0.0
+    sum50 = 0.0
+    count20 = 0
+    count50 = 0
+    gain_sum = 0.0
+    loss_sum = 0.0
+    ema12, weight12 = np.nan, 1.0
+    ema26, weight26 = np.nan, 1.0
+    sig, weight9 = np.nan, 1.0
+
+    for i in range(n):
+        x = close[i]
+
+        # Moving averages: add the price entering the window, drop the one leaving;
+        # a window containing a missing price has no average
+        if x == x:
+            sum20 += x
+            sum50 += x
+            count20 += 1
+            count50 += 1
+        if i >= 20 and close[i - 20] == close[i - 20]:
+            sum20 -= close[i - 20]
+            count20 -= 1
+        if i >= 50 and close[i - 50] == close[i - 50]:
+            sum50 -= close[i - 50]
+            count50 -= 1
+        sma20[i] = sum20 / 20.0 if count20 == 20 else np.nan
+        sma50[i] = sum50 / 50.0 if count50 == 50 else np.nan
+
+        # RSI: 14-period means of gains and losses (undefined deltas count as 0)
+        if i >= 1:
+            delta = x - close[i - 1]
+            if delta > 0:
+                gain_sum += delta
+            elif delta < 0:
+                loss_sum -= delta
+        if i >= 15:
+            delta = close[i - 14] - close[i - 15]
+            if delta > 0:
+                gain_sum -= delta
+            elif delta < 0:
+                loss_sum += delta
+        if i < 13:
+            rsi[i] = np.nan
+        elif loss_sum > 0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+        else:
+            rsi[i] = 100.0 if gain_sum > 0 else np.nan
+
+        # MACD: exponential moving averages seeded with the first price
+        ema12, weight12 = _ewm_step(ema12, weight12, x, alpha12)
+        ema26, weight26 = _ewm_step(ema26, weight26, x, alpha26)
+        macd[i] = ema12 - ema26
+        sig, weight9 = _ewm_step(sig, weight9, macd[i], alpha9)
+        signal[i] = sig
 
 
 class TechnicalAnalysis:
@@ -27,20 +112,24 @@ class TechnicalAnalysis:
         ta.plot_stock_data()
     """
 
-    def __init__(self, filepath):
+    def __init__(self, filepath, cache_path: str = "../data/extracted/combined_stocks_cache.parquet"):
         """
         Initialize the analysis by loading one or multiple stock CSV files.
 
         Args:
             filepath (str or list): File path, list of file paths, or directory path containing CSVs.
+            cache_path (str): Parquet cache of the raw combined CSVs, reused while it was
+                built from the same files and is newer than all of them. None disables it.
         """
         self.filepath = filepath
+        self.cache_path = cache_path
         if filepath != None:
             self.df = self._load_data()
 
     def _load_data(self) -> pd.DataFrame:
         """
-        Load and concatenate stock data from one or multiple CSV files.
+        Load and concatenate stock data from one or multiple CSV files, or from
+        the parquet cache when it is newer than all of them.
 
         Returns:
             pd.DataFrame: Combined stock price data.
@@ -52,45 +141,132 @@ class TechnicalAnalysis:
         elif isinstance(self.filepath, list):
             file_list = self.filepath
 
-        dataframes = []
-        for file in file_list:
-            df = pd.read_csv(file)
-            name = os.path.splitext(os.path.basename(file))[0].upper()
-            df['Company'] = name
-            dataframes.append(df)
+        cached_df = self._read_cache(file_list)
+        if cached_df is not None:
+            return cached_df
 
+        with ThreadPoolExecutor() as executor:
+            dataframes = list(executor.map(self._read_csv, file_list))
         full_df = pd.concat(dataframes, ignore_index=True)
-        os.makedirs("../data/extracted", exist_ok=True)
-        full_df.to_csv("../data/extracted/combined_stocks.csv", index=False)
+
+        # One categorical code per row instead of a copy of the company name
+        names = pd.Index([os.path.splitext(os.path.basename(file))[0].upper() for file in file_list])
+        companies = names.unique()
+        codes = np.repeat(companies.get_indexer(names), [len(df) for df in dataframes])
+        full_df['Company'] = pd.Categorical.from_codes(codes, categories=companies)
+
+        self._write_cache(full_df, file_list)
         return full_df
 
+    @staticmethod
+    def _to_pandas(table: pa.Table) -> pd.DataFrame:
+        """
+        Convert an Arrow table to pandas with date columns as datetime64 instead of
+        Python datetime.date objects (pyarrow reads YYYY-MM-DD values as date32).
+        """
+        schema = pa.schema(
+            [field.with_type(pa.timestamp('us')) if pa.types.is_date(field.type) else field
+             for field in table.schema],
+            metadata=table.schema.metadata,
+        )
+        return table.cast(schema).to_pandas()
+
+    @classmethod
+    def _read_csv(cls, file: str) -> pd.DataFrame:
+        """
+        Read one stock CSV with pyarrow's multithreaded parser.
+        """
+        convert_options = pv.ConvertOptions(strings_can_be_null=True)
+        return cls._to_pandas(pv.read_csv(file, convert_options=convert_options))
+
+    @staticmethod
+    def _source_key(file_list) -> bytes:
+        """
+        Identify a set of input files, stored in the cache's parquet metadata.
+        """
+        return json.dumps(sorted(os.path.abspath(file) for file in file_list)).encode()
+
+    def _read_cache(self, file_list):
+        """
+        Return the cached raw stock data if it was built from exactly these files
+        and is newer than all of them, otherwise None.
+        """
+        if not self.cache_path or not file_list or not os.path.exists(self.cache_path):
+            return None
+        if os.path.getmtime(self.cache_path) <= max(os.path.getmtime(file) for file in file_list):
+            return None
+        metadata = pq.read_schema(self.cache_path).metadata or {}
+        if metadata.get(b'source_files') != self._source_key(file_list):
+            return None
+        return self._to_pandas(pq.read_table(self.cache_path))
+
+    def _write_cache(self, df: pd.DataFrame, file_list):
+        """
+        Write the raw combined stock data to the parquet cache, tagged with its source files.
+        """
+        if not self.cache_path or not file_list:
+            return
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = {**(table.schema.metadata or {}), b'source_files': self._source_key(file_list)}
+        try:
+            if os.path.dirname(self.cache_path):
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            pq.write_table(table.replace_schema_metadata(metadata), self.cache_path, compression='zstd')
+        except OSError as e:
+            print(f"⚠️ Could not write stock data cache: {e}")
+
+    def save(self, path: str = "../data/extracted/combined_stocks.parquet"):
+        """
+        Save the current stock data to a zstd-compressed parquet file.
+
+        Args:
+            path (str): Destination file path.
+        """
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.df.to_parquet(path, engine='pyarrow', compression='zstd', index=False)
+
     def clean_data(self, date_column='date'):
         """
-        Clean and standardize date column and remove null entries.
+        Clean and standardize date column, remove rows missing the date or
+        closing price and downcast price columns to float32 (about 7
+        significant digits, a relative rounding error below 1e-7).
 
         Args:
             date_column (str): Name of the column to treat as date.
         """
         
         if date_column in self.df.columns:
-            self.df['date'] = pd.to_datetime(self.df['date'], errors='coerce').dt.tz_localize(None)
-        self.df.dropna(inplace=True)
+            self.df[date_column] = pd.to_datetime(self.df[date_column], errors='coerce').dt.tz_localize(None)
+
+        # Only the date and closing price are required; other gaps are kept
+        required = [column for column in (date_column, 'Close') if column in self.df.columns]
+        self.df = self.df.dropna(subset=required)
+
+        # Volume stays integer: float32 cannot represent counts above 2**24 exactly
+        for column in ['Open', 'High', 'Low', 'Close', 'Adj Close']:
+            if column in self.df.columns:
+                self.df[column] = pd.to_numeric(self.df[column], downcast='float')
 
     def calculate_indicators(self):
         """
         Calculate technical indicators using TA-Lib: MA20, MA50, RSI, and MACD.
         """
-        self.df['MA20'] = talib.SMA(self.df['Close'], timeperiod=20)
-        self.df['MA50'] = talib.SMA(self.df['Close'], timeperiod=50)
-        self.df['RSI'] = talib.RSI(self.df['Close'], timeperiod=14)
+        # TA-Lib only accepts float64 input
+        close = self.df['Close'].astype('float64')
+        self.df['MA20'] = talib.SMA(close, timeperiod=20)
+        self.df['MA50'] = talib.SMA(close, timeperiod=50)
+        self.df['RSI'] = talib.RSI(close, timeperiod=14)
         self.df['MACD'], self.df['MACD_signal'], _ = talib.MACD(
-            self.df['Close'], fastperiod=12, slowperiod=26, signalperiod=9
+            close, fastperiod=12, slowperiod=26, signalperiod=9
         )
 
     def plot_moving_averages(self):
         """
         Plot 20-day and 50-day moving averages along with the closing price.
         """
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(12, 6))
         plt.plot(self.df['Close'], label='Close Price')
         plt.plot(self.df['MA20'], label='MA 20')
@@ -107,6 +283,8 @@ class TechnicalAnalysis:
         """
         Plot the Relative Strength Index (RSI) with overbought/oversold thresholds.
         """
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(10, 4))
         plt.plot(self.df['RSI'], label='RSI', color='purple')
         plt.axhline(70, linestyle='--', color='red', alpha=0.5)
@@ -122,6 +300,8 @@ class TechnicalAnalysis:
         """
         Plot MACD and signal line to show momentum trends.
         """
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(12, 4))
         plt.plot(self.df['MACD'], label='MACD', color='blue')
         plt.plot(self.df['MACD_signal'], label='Signal Line', color='orange')
@@ -140,11 +320,15 @@ class TechnicalAnalysis:
         Returns:
             dict: A dictionary of financial summary statistics.
         """
+        # Plain NumPy reductions skip pandas' per-call dispatch; NaNs are ignored as in pandas
+        close = self.df['Close'].to_numpy()
+        volume = self.df['Volume'].to_numpy(dtype=np.float64)
+        volume = volume[~np.isnan(volume)]
         summary = {
-            'Average Close': self.df['Close'].mean(),
-            'Max Close': self.df['Close'].max(),
-            'Min Close': self.df['Close'].min(),
-            'Volume Std Dev': self.df['Volume'].std()
+            'Average Close': np.nanmean(close),
+            'Max Close': np.nanmax(close),
+            'Min Close': np.nanmin(close),
+            'Volume Std Dev': volume.std(ddof=1)
         }
         return summary
 
@@ -185,32 +369,32 @@ class TechnicalAnalysis:
 
     def calculate_technical_indicators(self) -> pd.DataFrame:
         """
-        Calculate basic technical indicators for the stock data.
-
-        Args:
-            data (pd.DataFrame): Historical stock data
+        Calculate basic technical indicators for the stock data in a single
+        compiled pass. Use calculate_indicators for the TA-Lib implementation.
 
         Returns:
             pd.DataFrame: Data with added technical indicators
         """
         df = self.df.copy()
 
-        # Calculate Moving Averages
-        df['SMA_20'] = df['Close'].rolling(window=20).mean()
-        df['SMA_50'] = df['Close'].rolling(window=50).mean()
-
-        # Calculate RSI (Relative Strength Index)
-        delta = df['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        df['RSI'] = 100 - (100 / (1 + rs))
-
-        # Calculate MACD
-        exp1 = df['Close'].ewm(span=12, adjust=False).mean()
-        exp2 = df['Close'].ewm(span=26, adjust=False).mean()
-        df['MACD'] = exp1 - exp2
-        df['Signal_Line'] = df['MACD'].ewm(span=9, adjust=False).mean()
+        # yfinance returns (Price, Ticker) columns, where 'Close' is a one-column frame
+        close = df['Close']
+        if isinstance(close, pd.DataFrame):
+            close = close.iloc[:, 0]
+
+        # float32 prices (see clean_data) stay float32; window sums accumulate in float64
+        close = close.to_numpy()
+        if close.dtype != np.float32:
+            close = close.astype(np.float64)
+        close = np.ascontiguousarray(close)
+        sma20, sma50, rsi, macd, signal = (np.empty_like(close) for _ in range(5))
+        _indicators(close, sma20, sma50, rsi, macd, signal)
+
+        df['SMA_20'] = sma20
+        df['SMA_50'] = sma50
+        df['RSI'] = rsi
+        df['MACD'] = macd
+        df['Signal_Line'] = signal
         self.df = df
         return df
 
@@ -222,6 +406,9 @@ class TechnicalAnalysis:
             indicators (bool): If True, plot MA20 and MA50.
             volume (bool): If True, plot volume bars.
         """
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
         fig = make_subplots(
             rows=2 if volume else 1,
             cols=1,
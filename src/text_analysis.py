@@ -1,10 +1,13 @@
 import pandas as pd
 import os
-import matplotlib.pyplot as plt
-import seaborn as sns
-from wordcloud import WordCloud
-from sklearn.feature_extraction.text import CountVectorizer
+import re
+from collections import Counter
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
 from typing import List, Tuple
+from src.ingest_data import read_csv_columns
+
+# Same tokens as CountVectorizer's default token_pattern
+_TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
 
 class TextAnalyzer:
     """
@@ -23,19 +26,22 @@ class TextAnalyzer:
 
     def _load_data(self) -> pd.DataFrame:
         """
-        Load and validate CSV file.
+        Load and validate the headline column of the CSV file.
 
         Returns:
             pd.DataFrame: Loaded dataset
         """
         if not os.path.exists(self.filepath):
             raise FileNotFoundError(f"File not found: {self.filepath}")
-        return pd.read_csv(self.filepath)
+        return read_csv_columns(self.filepath, ['headline'])
 
     def generate_wordcloud(self):
         """
         Generate and display a word cloud from headlines.
         """
+        import matplotlib.pyplot as plt
+        from wordcloud import WordCloud
+
         text = ' '.join(self.df['headline'].dropna().astype(str))
         wordcloud = WordCloud(width=800, height=400, background_color='white').generate(text)
         plt.figure(figsize=(10, 5))
@@ -46,7 +52,7 @@ class TextAnalyzer:
 
     def get_top_keywords(self, top_n: int = 20) -> List[Tuple[str, int]]:
         """
-        Extract the most frequent keywords using CountVectorizer.
+        Extract the most frequent keywords, excluding English stop words.
 
         Args:
             top_n (int): Number of top keywords to return.
@@ -55,12 +61,12 @@ class TextAnalyzer:
             List[Tuple[str, int]]: List of (keyword, frequency)
         """
         headlines = self.df['headline'].dropna().astype(str)
-        vectorizer = CountVectorizer(stop_words='english')
-        X = vectorizer.fit_transform(headlines)
-        word_counts = X.sum(axis=0).A1
-        vocab = vectorizer.get_feature_names_out()
-        freq_dict = dict(zip(vocab, word_counts))
-        return sorted(freq_dict.items(), key=lambda x: x[1], reverse=True)[:top_n]
+        word_counts = Counter()
+        for headline in headlines:
+            word_counts.update(_TOKEN_PATTERN.findall(headline.lower()))
+        for stop_word in ENGLISH_STOP_WORDS:
+            word_counts.pop(stop_word, None)
+        return word_counts.most_common(top_n)
 
     def plot_top_keywords(self, top_n: int = 20):
         """
@@ -69,6 +75,9 @@ class TextAnalyzer:
         Args:
             top_n (int): Number of top keywords to plot.
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         keywords = self.get_top_keywords(top_n)
         words, freqs = zip(*keywords)
         plt.figure(figsize=(12, 6))
@@ -1,7 +1,6 @@
 import pandas as pd
 import os
-import matplotlib.pyplot as plt
-import seaborn as sns
+from src.ingest_data import read_csv_columns
 
 class TimeSeriesAnalysis:
     """
@@ -20,28 +19,38 @@ class TimeSeriesAnalysis:
 
     def _load_data(self) -> pd.DataFrame:
         """
-        Load and validate CSV file.
+        Load and validate the date and publisher columns of the CSV file.
 
         Returns:
             pd.DataFrame: Loaded dataset
         """
         if not os.path.exists(self.filepath):
             raise FileNotFoundError(f"File not found: {self.filepath}")
-        df = pd.read_csv(self.filepath)
+        df = read_csv_columns(self.filepath, ['date', 'publisher'])
         if 'date' in df.columns:
             df['date'] = pd.to_datetime(df['date'], errors='coerce')
         return df
 
-    def plot_article_frequency_over_time(self):
+    def plot_article_frequency_over_time(self, max_points: int = 1000):
         """
-        Plot the number of articles published per day.
+        Plot the number of articles published per day, or per week when the
+        date range spans more than max_points days.
+
+        Args:
+            max_points (int): Maximum number of daily points to plot before resampling weekly.
         """
-        self.df['date_only'] = self.df['date'].dt.date
-        daily_counts = self.df['date_only'].value_counts().sort_index()
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        counts = self.df[['date']].dropna().set_index('date').resample('D').size()
+        period = "Day"
+        if len(counts) > max_points:
+            counts = counts.resample('W').sum()
+            period = "Week"
 
         plt.figure(figsize=(12, 5))
-        sns.lineplot(x=daily_counts.index, y=daily_counts.values)
-        plt.title("📈 Article Publication Frequency Over Time")
+        sns.lineplot(x=counts.index, y=counts.to_numpy())
+        plt.title(f"📈 Article Publication Frequency Over Time (per {period})")
         plt.xlabel("Date")
         plt.ylabel("Number of Articles")
         plt.xticks(rotation=45)
@@ -53,6 +62,9 @@ class TimeSeriesAnalysis:
         """
         Plot the distribution of article publication times by hour.
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         self.df['hour'] = self.df['date'].dt.hour
         plt.figure(figsize=(10, 5))
         sns.histplot(self.df['hour'], bins=24, kde=True)
@@ -88,8 +100,9 @@ class TimeSeriesAnalysis:
         Returns:
             pd.Series: Top email domains
         """
-        email_publishers = self.df['publisher'].dropna().astype(str)
-        domains = email_publishers[email_publishers.str.contains('@')].apply(lambda x: x.split('@')[-1])
+        publishers = self.df['publisher'].astype('string')
+        email_publishers = publishers[publishers.str.contains('@', regex=False, na=False)]
+        domains = email_publishers.str.rsplit('@', n=1).str[-1]
         domain_counts = domains.value_counts().head(top_n)
         print("\n📧 Top Email Domains:")
         print(domain_counts)
@@ -0,0 +1,17 @@
+import pandas as pd
+
+from src.correlation_analysis import calculate_daily_returns
+
+
+def test_daily_returns_backends_agree_with_missing_dates():
+    df = pd.DataFrame({
+        'date': pd.to_datetime(['2020-01-02', None, '2020-01-01', '2020-01-03', '2020-01-02']),
+        'Close': [10.0, 50.0, 10.0, 12.0, 11.0],
+    })
+    expected = calculate_daily_returns(df).reset_index(drop=True)
+    result = calculate_daily_returns(df, backend='polars')
+
+    # Rows without a date sort last, so they never feed the first day's return
+    assert pd.isna(expected['daily_return'].iloc[0])
+    assert pd.isna(expected['date'].iloc[-1])
+    pd.testing.assert_frame_equal(result, expected)
@@ -0,0 +1,23 @@
+import pandas as pd
+
+from src.ingest_data import read_csv_columns
+
+
+def test_read_csv_columns(tmp_path):
+    path = tmp_path / 'news.csv'
+    path.write_text('headline,publisher,date\nStocks rally,Reuters,2020-06-05 10:30:54-04:00\nNo date,,\n')
+
+    df = read_csv_columns(path, ['date', 'headline'])
+
+    assert list(df.columns) == ['date', 'headline']
+    assert df['date'].iloc[0] == '2020-06-05 10:30:54-04:00'
+    assert pd.isna(df['date'].iloc[1])
+
+
+def test_read_csv_columns_skips_missing_columns(tmp_path):
+    path = tmp_path / 'news.csv'
+    path.write_text('headline,date\nStocks rally,2020-06-05\n')
+
+    df = read_csv_columns(path, ['headline', 'publisher', 'date'])
+
+    assert list(df.columns) == ['headline', 'date']
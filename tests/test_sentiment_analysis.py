@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.sentiment_analysis import apply_sentiment_analysis
+
+HEADLINES = [
+    "The market is not very good",
+    "Very bad news for Apple",
+    "Really not good results",
+    "Apple isn't a great buy",
+    "Shares don't look good",
+    "Tesla stock is great!!!",
+    "Great quarter (!)",
+    "Not a good day... for Amazon",
+    "Stocks rally as earnings beat expectations",
+    "Never been so bad",
+    "extremely happy investors, no good news",
+    "'Best' week ever for Nvidia",
+    "",
+    None,
+]
+
+
+def scores(method):
+    df = pd.DataFrame({'headline': HEADLINES})
+    return apply_sentiment_analysis(df, method=method, n_jobs=1)['sentiment'].to_numpy()
+
+
+def test_lexicon_matches_textblob():
+    np.testing.assert_allclose(scores('lexicon'), scores('textblob'), rtol=1e-12, atol=1e-12)
+
+
+def test_lexicon_examples():
+    lexicon = dict(zip(HEADLINES[:2], scores('lexicon')))
+    assert lexicon["The market is not very good"] == pytest.approx(-0.2692, abs=1e-4)
+    assert lexicon["Very bad news for Apple"] == pytest.approx(-0.91)
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        apply_sentiment_analysis(pd.DataFrame({'headline': ['good']}), method='vader')
+
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.technical_analysis import TechnicalAnalysis
+
+
+def pandas_indicators(close: pd.Series) -> pd.DataFrame:
+    """
+    The rolling/ewm formulas the compiled kernel replaced.
+    """
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    exp1 = close.ewm(span=12, adjust=False).mean()
+    exp2 = close.ewm(span=26, adjust=False).mean()
+    macd = exp1 - exp2
+    return pd.DataFrame({
+        'SMA_20': close.rolling(window=20).mean(),
+        'SMA_50': close.rolling(window=50).mean(),
+        'RSI': 100 - (100 / (1 + gain / loss)),
+        'MACD': macd,
+        'Signal_Line': macd.ewm(span=9, adjust=False).mean(),
+    })
+
+
+def calculate(df: pd.DataFrame) -> pd.DataFrame:
+    ta = TechnicalAnalysis(None)
+    ta.df = df
+    return ta.calculate_technical_indicators()
+
+
+@pytest.fixture
+def close():
+    rng = np.random.default_rng(0)
+    return pd.Series(100 + rng.normal(0, 1, 300).cumsum())
+
+
+def test_indicators_match_pandas(close):
+    result = calculate(pd.DataFrame({'Close': close}))
+    expected = pandas_indicators(close)
+    pd.testing.assert_frame_equal(result[expected.columns], expected, rtol=1e-9)
+
+
+def test_indicators_match_pandas_with_missing_prices(close):
+    close[[0, 5, 60, 61, 62, 150, 299]] = np.nan
+    result = calculate(pd.DataFrame({'Close': close}))
+    expected = pandas_indicators(close)
+    pd.testing.assert_frame_equal(result[expected.columns], expected, rtol=1e-9)
+
+
+def test_indicators_with_float32_prices(close):
+    result = calculate(pd.DataFrame({'Close': close.astype(np.float32)}))
+    expected = pandas_indicators(close)
+    np.testing.assert_allclose(result['SMA_20'], expected['SMA_20'], rtol=1e-5)
+    np.testing.assert_allclose(result['MACD'], expected['MACD'], atol=1e-3)
+
+
+def test_indicators_with_yfinance_columns(close):
+    # yf.download returns (Price, Ticker) columns, so df['Close'] is a one-column frame
+    columns = pd.MultiIndex.from_tuples([('Close', 'AAPL'), ('Volume', 'AAPL')], names=['Price', 'Ticker'])
+    df = pd.DataFrame(np.column_stack([close, np.ones(len(close))]), columns=columns)
+    result = calculate(df)
+    expected = pandas_indicators(close)
+    for column in expected.columns:
+        np.testing.assert_allclose(result[column].to_numpy().ravel(), expected[column], rtol=1e-9)
+
+
+def test_summary_metrics_match_pandas(close):
+    close[[3, 40]] = np.nan
+    volume = pd.Series(np.arange(len(close)) * 1000.0)
+    volume[[7, 8]] = np.nan
+    ta = TechnicalAnalysis(None)
+    ta.df = pd.DataFrame({'Close': close.astype(np.float32), 'Volume': volume})
+    metrics = ta.summary_metrics()
+    assert metrics == {
+        'Average Close': ta.df['Close'].mean(),
+        'Max Close': ta.df['Close'].max(),
+        'Min Close': ta.df['Close'].min(),
+        'Volume Std Dev': ta.df['Volume'].std(),
+    }
+
+
+def test_load_data_parses_dates(tmp_path):
+    for name in ('aapl', 'msft'):
+        (tmp_path / f'{name}.csv').write_text('Date,Close,Volume\n2020-01-02,10.5,100\n2020-01-03,11.0,\n')
+    cache_path = tmp_path / 'cache.parquet'
+
+    df = TechnicalAnalysis(str(tmp_path), cache_path=str(cache_path)).df
+    cached = TechnicalAnalysis(str(tmp_path), cache_path=str(cache_path)).df
+
+    for frame in (df, cached):
+        assert pd.api.types.is_datetime64_dtype(frame['Date'])
+        assert list(frame['Company']) == ['AAPL', 'AAPL', 'MSFT', 'MSFT']
+    pd.testing.assert_frame_equal(cached, df)
+
+    ta = TechnicalAnalysis(None)
+    ta.df = df
+    ta.save(str(tmp_path / 'combined.parquet'))
+    assert pd.api.types.is_datetime64_dtype(pd.read_parquet(tmp_path / 'combined.parquet')['Date'])